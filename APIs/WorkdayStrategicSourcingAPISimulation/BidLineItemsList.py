@@ -1,4 +1,3 @@
-aaa
 """
 This module provides functionality for retrieving and filtering bid line items in the
 Workday Strategic Sourcing system. It supports comprehensive filtering capabilities
@@ -5,9 +5,16 @@ Database structure and persistence helpers for Workday Strategic Sourcing API Si
 import json
 from typing import Dict, Any
 
+try:
+    import orjson
+except ImportError:  # Optional: the stdlib json module is the fallback.
+    orjson = None
+
 # ---------------------------------------------------------------------------------------
 # In-Memory Database Structure
 # ---------------------------------------------------------------------------------------
+# load_state() rebinds DB and callers may replace whole tables, so API modules must
+# resolve db.DB[...] at call time rather than holding references taken at import.
 DB: Dict[str, Any] = {
     'attachments': {},
     'awards': {'award_line_items': [], 'awards': []},
@@ -67,16 +74,42 @@ DB: Dict[str, Any] = {
 # Persistence Helpers
 # -------------------------------------------------------------------
 def save_state(filepath: str) -> None:
-    """Saves the current state of the API to a JSON file."""
-    with open(filepath, "w") as f:
+    """Saves the current state of the API to a JSON file.
+
+    Uses orjson when it is installed, falling back to the stdlib json module for
+    states orjson cannot write faithfully (integers wider than 64 bits, NaN or
+    Infinity), so the saved values never depend on which encoder ran. Like
+    json.dump, non-string keys are written as strings. Files are UTF-8 either way.
+    """
+    if orjson is not None:
+        try:
+            data = orjson.dumps(DB, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            data = None
+        # orjson writes NaN and Infinity as null, so any null in its output may be a
+        # lost float; those states (and any holding None) go through json.dump instead.
+        if data is not None and b"null" not in data:
+            with open(filepath, "wb") as f:
+                f.write(data)
+            return
+    with open(filepath, "w", encoding="utf-8") as f:
         json.dump(DB, f)
 
 
 def load_state(filepath: str) -> None:
-    """Loads the API state from a JSON file."""
+    """Loads the API state from a JSON file written by save_state()."""
+    global DB
     try:
-        with open(filepath, "r") as f:
-            global DB
+        if orjson is not None:
+            with open(filepath, "rb") as f:
+                data = f.read()
+            try:
+                DB = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # The stdlib writer emits NaN/Infinity, which orjson rejects.
+                DB = json.loads(data)
+            return
+        with open(filepath, "r", encoding="utf-8") as f:
             DB = json.load(f)
     except FileNotFoundError:
         pass 
\ No newline at end of file
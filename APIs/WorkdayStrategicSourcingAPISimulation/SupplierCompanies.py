@@ -58,18 +58,14 @@ def get(filter: Optional[Dict[str, Any]] = None, include: Optional[str] = None,
                 - Other company-specific fields
             - int: HTTP status code (200 for success)
     """
-    companies = list(db.DB["suppliers"]["supplier_companies"].values())
+    companies = db.DB["suppliers"]["supplier_companies"].values()
     if filter:
-        filtered_companies = []
-        for company in companies:
-            match = True
-            for key, value in filter.items():
-                if company.get(key) != value:
-                    match = False
-                    break
-            if match:
-                filtered_companies.append(company)
-        companies = filtered_companies
+        # Filter straight off the dict view; only matches are materialized.
+        criteria = filter.items()
+        companies = [company for company in companies
+                     if all(company.get(key) == value for key, value in criteria)]
+    else:
+        companies = list(companies)
     if include:
         # Simulate include logic (not fully implemented)
         pass
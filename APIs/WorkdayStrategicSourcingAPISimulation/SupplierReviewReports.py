@@ -11,18 +11,18 @@ review report management capabilities, allowing users to:
 - Access the supplier review report schema definition
 """
 
-from typing import List, Dict, Any
+from typing import Sequence, Dict, Any
 from .SimulationEngine import db
 
-def get_entries() -> List[Dict[str, Any]]:
+def get_entries() -> Sequence[Dict[str, Any]]:
     """
     Retrieves all supplier review report entries from the database.
 
-    This function returns a list of all supplier review report entries stored in
+    This function returns all supplier review report entries stored in
     the simulation database.
 
     Returns:
-        List[Dict[str, Any]]: A list of supplier review report entries, where
+        Sequence[Dict[str, Any]]: The stored supplier review report entries, where
             each entry is a dictionary containing review-specific data fields
             such as:
             - Review scores
@@ -30,8 +30,9 @@ def get_entries() -> List[Dict[str, Any]]:
             - Review dates
             - Review comments
             - Other review-related metrics
+            An empty tuple if the database has no entries table.
     """
-    return db.DB["reports"].get('supplier_review_reports_entries', [])
+    return db.DB["reports"].get('supplier_review_reports_entries', ())
 
 def get_schema() -> Dict[str, Any]:
     """
@@ -12,24 +12,25 @@ supplier management capabilities, allowing users to:
 - Look up individual suppliers by their unique identifier
 """
 
-from typing import List, Dict, Any, Optional
+from typing import Sequence, Dict, Any, Optional
 from .SimulationEngine import db
 
-def get_suppliers() -> List[Dict[str, Any]]:
+def get_suppliers() -> Sequence[Dict[str, Any]]:
     """
-    Retrieves a list of all suppliers from the database.
+    Retrieves all suppliers from the database.
 
     This function returns all supplier entries stored in the simulation database.
 
     Returns:
-        List[Dict[str, Any]]: A list of supplier dictionaries, where each
+        Sequence[Dict[str, Any]]: The stored supplier list, where each
             dictionary contains supplier-specific data fields such as:
             - "id" (int): The unique identifier of the supplier
             - "name" (str): The name of the supplier
             - "status" (str): The current status of the supplier
             - Other supplier-specific fields
+            An empty tuple if the database has no supplier table.
     """
-    return db.DB["reports"].get('suppliers', [])
+    return db.DB["reports"].get('suppliers', ())
 
 def get_supplier(supplier_id: int) -> Optional[Dict[str, Any]]:
     """
@@ -45,8 +46,7 @@ def get_supplier(supplier_id: int) -> Optional[Dict[str, Any]]:
         Optional[Dict[str, Any]]: If found, returns a dictionary containing the
             supplier's complete information. If not found, returns None.
     """
-    suppliers = db.DB["reports"].get('suppliers', [])
-    for supplier in suppliers:
+    for supplier in db.DB["reports"].get('suppliers', ()):
         if supplier.get('id') == supplier_id:
             return supplier
     return None 
\ No newline at end of file
@@ -68,17 +68,33 @@ def patch(id: str, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     for user in db.DB["scim"]["users"]:
         if user.get("id") == id:
-            for operation in body.get("Operations", []):
-                op = operation.get("op")
-                path = operation.get("path")
-                value = operation.get("value")
-                if op == "replace" and path and value:
-                    parts = path.split(".")
-                    if len(parts) == 1:
-                        user[parts[0]] = value
+            user.update(_replace_operations(body))
             return user
     return None
 
+def _replace_operations(body: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Collapses the supported PATCH operations into a single attribute update.
+
+    Only "replace" operations with a non-empty value and a top-level path are
+    supported; anything else is skipped. When several operations target the
+    same attribute, the last one wins, as if they had been applied in order.
+
+    Args:
+        body (Dict[str, Any]): Dictionary containing the PATCH operations under
+            the "Operations" key.
+
+    Returns:
+        Dict[str, Any]: A mapping of attribute name to its new value.
+    """
+    updates = {}
+    for operation in body.get("Operations", []):
+        path = operation.get("path")
+        value = operation.get("value")
+        if operation.get("op") == "replace" and path and value and "." not in path:
+            updates[path] = value
+    return updates
+
 def put(id: str, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Updates a User resource using PUT operation (see section 3.5.1 of RFC 7644).
@@ -95,10 +111,11 @@ def put(id: str, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         Optional[Dict[str, Any]]: If found and updated, returns the new user
             dictionary with the original ID. If not found, returns None.
     """
-    for i, user in enumerate(db.DB["scim"]["users"]):
+    users = db.DB["scim"]["users"]
+    for i, user in enumerate(users):
         if user.get("id") == id:
-            db.DB["scim"]["users"][i] = body
             body["id"] = id
+            users[i] = body
             return body
     return None
 
@@ -115,8 +132,9 @@ def delete(id: str) -> bool:
         bool: True if the user was found and deleted, False if the user was
             not found.
     """
-    for i, user in enumerate(db.DB["scim"]["users"]):
+    users = db.DB["scim"]["users"]
+    for i, user in enumerate(users):
         if user.get("id") == id:
-            del db.DB["scim"]["users"][i]
+            del users[i]
             return True
     return False 
\ No newline at end of file
@@ -12,9 +12,20 @@ user management capabilities, allowing users to:
 - Create new users in the system
 """
 
-from typing import List, Dict, Any, Optional
+import re
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, List, Dict, Any, Optional
 from .SimulationEngine import db
 
+_COMPARISON = re.compile(r'(\w+)\s+(eq|co|sw)\s+"([^"]*)"', re.IGNORECASE)
+_CONJUNCTION = re.compile(r'\s+and\s+', re.IGNORECASE)
+_OPERATORS = {
+    "eq": lambda actual, expected: actual == expected,
+    "co": lambda actual, expected: isinstance(actual, str) and expected in actual,
+    "sw": lambda actual, expected: isinstance(actual, str) and actual.startswith(expected),
+}
+
 def get(attributes: Optional[str] = None, filter: Optional[str] = None,
         startIndex: Optional[int] = None, count: Optional[int] = None,
         sortBy: Optional[str] = None, sortOrder: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -29,7 +40,8 @@ def get(attributes: Optional[str] = None, filter: Optional[str] = None,
             to include in the response. If specified, only these attributes will
             be returned for each user.
         filter (Optional[str], default=None): Filter criteria for the user search.
-            Currently implements simple string matching.
+            Supports 'attribute eq|co|sw "value"' comparisons joined with "and";
+            any other filter falls back to simple string matching.
         startIndex (Optional[int], default=None): The 1-based index of the first
             result in the current set of list results.
         count (Optional[int], default=None): The number of resources returned in
@@ -45,30 +57,36 @@ def get(attributes: Optional[str] = None, filter: Optional[str] = None,
             only includes the requested attributes for each user.
     """
     users = db.DB["scim"]["users"]
+    if not (filter or sortBy or attributes or (startIndex and count)):
+        # Plain listing: hand back the stored list, as the full path would.
+        return users
+
     if filter:
-        # Simple filter simulation
-        filtered_users = []
-        for user in users:
-            if filter in str(user):
-                filtered_users.append(user)
-        users = filtered_users
+        predicate = _compile_filter(filter)
+        if predicate is None:
+            # Simple filter simulation
+            users = [user for user in users if filter in str(user)]
+        else:
+            users = [user for user in users if predicate(user)]
+
+    if sortBy:
+        reverse = sortOrder == "descending"
+        try:
+            users = sorted(users, key=itemgetter(sortBy), reverse=reverse)
+        except KeyError:
+            # Some users lack the attribute; those sort as an empty string.
+            users = sorted(users, key=lambda x: x.get(sortBy, ""), reverse=reverse)
 
+    # Paginate after sorting (RFC 7644 section 3.4.2.4) and before projecting,
+    # so only the returned page is copied.
     if startIndex and count:
         start = startIndex - 1
         end = start + count
         users = users[start:end]
 
-    if sortBy:
-        reverse = sortOrder == "descending"
-        users.sort(key=lambda x: x.get(sortBy, ""), reverse=reverse)
-
     if attributes:
         attrs = attributes.split(",")
-        result = []
-        for user in users:
-            filtered_user = {attr: user.get(attr) for attr in attrs if attr in user}
-            result.append(filtered_user)
-        return result
+        return [{attr: user[attr] for attr in attrs if attr in user} for user in users]
     return users
 
 def post(body: Dict[str, Any]) -> Dict[str, Any]:
@@ -88,7 +106,52 @@ def post(body: Dict[str, Any]) -> Dict[str, Any]:
             - "id" (str): The newly assigned unique identifier
             - All provided user attributes
     """
-    user_id = str(len(db.DB["scim"]["users"]) + 1)
-    body["id"] = user_id
-    db.DB["scim"]["users"].append(body)
-    return body 
\ No newline at end of file
+    scim = db.DB["scim"]
+    if "user_id_counter" not in scim:
+        # Fresh or loaded tables carry no counter yet; resume after the highest numeric id.
+        scim["user_id_counter"] = max(
+            (int(user["id"]) for user in scim["users"] if str(user.get("id", "")).isdecimal()),
+            default=0,
+        ) + 1
+    user_id = scim["user_id_counter"]
+    scim["user_id_counter"] = user_id + 1
+    body["id"] = str(user_id)
+    scim["users"].append(body)
+    return body
+
+@lru_cache(maxsize=512)
+def _compile_filter(filter: str) -> Optional[Callable[[Dict[str, Any]], bool]]:
+    """
+    Compiles a SCIM filter expression into a predicate over user dictionaries.
+
+    The compiled predicate is cached per filter string, so paging through a
+    filtered list only parses the expression once.
+
+    Args:
+        filter (str): The filter expression, made of 'attribute op "value"'
+            comparisons joined with "and", where op is one of "eq", "co" or "sw".
+
+    Returns:
+        Optional[Callable[[Dict[str, Any]], bool]]: A predicate returning True
+            for matching users, or None if the expression is not supported.
+    """
+    text = filter.strip()
+    comparisons = []
+    pos = 0
+    while True:
+        match = _COMPARISON.match(text, pos)
+        if not match:
+            return None
+        attr, op, value = match.groups()
+        comparisons.append((attr, _OPERATORS[op.lower()], value))
+        pos = match.end()
+        if pos == len(text):
+            break
+        conjunction = _CONJUNCTION.match(text, pos)
+        if not conjunction:
+            return None
+        pos = conjunction.end()
+
+    def predicate(user: Dict[str, Any]) -> bool:
+        return all(test(user.get(attr), value) for attr, test, value in comparisons)
+    return predicate
@@ -67,118 +67,7 @@ Attachments:
 The package also includes a simulation engine and test suite for testing and validation purposes.
 """
 
-from . import (
-    # Core API modules
-    Projects,
-    ProjectById,
-    ProjectByExternalId,
-    ProjectTypes,
-    ProjectTypeById,
-    ProjectRelationshipsSupplierContacts,
-    ProjectRelationshipsSupplierContactsExternalId,
-    ProjectRelationshipsSupplierCompanies,
-    ProjectRelationshipsSupplierCompaniesExternalId,
-    ProjectsDescribe,
-    
-    # Supplier related modules
-    Suppliers,
-    SupplierCompanies,
-    SupplierCompanyById,
-    SupplierCompanyByExternalId,
-    SupplierCompanyContacts,
-    SupplierCompanyContactById,
-    SupplierCompanyContactsByExternalId,
-    SupplierContacts,
-    SupplierContactById,
-    SupplierContactByExternalId,
-    SupplierCompanySegmentations,
-    SupplierCompaniesDescribe,
-    
-    # Contact related modules
-    ContactTypes,
-    ContactTypeById,
-    ContactTypeByExternalId,
-    
-    # Spend related modules
-    SpendCategories,
-    SpendCategoryById,
-    SpendCategoryByExternalId,
-    
-    # User related modules
-    Users,
-    UserById,
-    
-    # Contract related modules
-    Contracts,
-    ContractAward,
-    Awards,
-    
-    # Event related modules
-    Events,
-    EventBids,
-    BidsById,
-    BidsDescribe,
-    BidLineItems,
-    BidLineItemById,
-    BidLineItemsList,
-    BidLineItemsDescribe,
-    EventTemplates,
-    EventWorksheets,
-    EventWorksheetById,
-    EventWorksheetLineItems,
-    EventWorksheetLineItemById,
-    EventSupplierCompanies,
-    EventSupplierCompaniesExternalId,
-    EventSupplierContacts,
-    EventSupplierContactsExternalId,
-    
-    # Field related modules
-    Fields,
-    FieldById,
-    FieldByExternalId,
-    FieldGroups,
-    FieldGroupById,
-    FieldOptions,
-    FieldOptionsByFieldId,
-    FieldOptionById,
-    
-    # Payment related modules
-    PaymentCurrencies,
-    PaymentCurrenciesId,
-    PaymentCurrenciesExternalId,
-    PaymentTerms,
-    PaymentTermsId,
-    PaymentTermsExternalId,
-    PaymentTypes,
-    PaymentTypesId,
-    PaymentTypesExternalId,
-    
-    # Report related modules
-    ProjectReports,
-    ProjectMilestoneReports,
-    SupplierReports,
-    SupplierReviewReports,
-    PerformanceReviewReports,
-    PerformanceReviewAnswerReports,
-    ContractReports,
-    ContractMilestoneReports,
-    EventReports,
-    SavingsReports,
-    
-    # SCIM related modules
-    ServiceProviderConfig,
-    ResourceTypes,
-    ResourceTypeById,
-    Schemas,
-    SchemaById,
-    
-    # Attachments
-    Attachments,
-)
-
-# Expose subdirectories
-from . import SimulationEngine
-from . import test
+import importlib
 
 __all__ = [
     # Core API modules
@@ -234,4 +123,24 @@ __all__ = [
     
     # Subdirectories
     'SimulationEngine', 'test'
-] 
\ No newline at end of file
+]
+
+# Submodules are imported on first attribute access (PEP 562) so that using one
+# endpoint does not pay for importing every other one.
+_SUBMODULES = frozenset(__all__) - {"SimulationEngine"}
+
+# Every endpoint module depends on the simulation engine, so load it eagerly.
+from . import SimulationEngine
+importlib.import_module(".SimulationEngine.db", __name__)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES)